@@ -1,6 +1,8 @@
 """Deal deduplication system to identify and merge duplicate products."""
 
 import hashlib
+from bisect import bisect_right
+from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple
 
 from fuzzywuzzy import fuzz
@@ -36,6 +38,7 @@ class DealDeduplicator:
         """Group deals that are likely duplicates."""
         groups = []
         processed = set()
+        deal_keys, blocks = self._build_blocks(deals)
         
         for i, deal in enumerate(deals):
             if i in processed:
@@ -45,11 +48,12 @@ class DealDeduplicator:
             group = [deal]
             processed.add(i)
             
-            # Find similar deals
-            for j, other_deal in enumerate(deals[i+1:], i+1):
+            # Find similar deals among those sharing a blocking key
+            for j in self._later_candidates(i, deal_keys[i], blocks):
                 if j in processed:
                     continue
                 
+                other_deal = deals[j]
                 if self._are_duplicates(deal, other_deal):
                     group.append(other_deal)
                     processed.add(j)
@@ -58,6 +62,46 @@ class DealDeduplicator:
         
         return groups
     
+    def _blocking_keys(self, deal: Deal) -> List[Tuple]:
+        """Get keys that any deal duplicating this one must share with it.
+        
+        Each rule in ``_are_duplicates`` requires at least one of these fields
+        to match exactly, so deals with no key in common are never duplicates.
+        """
+        keys = [('title', deal.title, deal.brand)]  # Exact match
+        if self._has_product_attributes(deal):
+            keys.append(('brand', deal.brand, deal.sport, deal.category))  # Fuzzy title match
+        if deal.gtin:
+            keys.append(('gtin', deal.gtin))
+        if deal.mpn:
+            keys.append(('mpn', deal.mpn))
+        if deal.sku:
+            keys.append(('sku', deal.sku, deal.retailer))
+        return keys
+    
+    def _build_blocks(self, deals: List[Deal]) -> Tuple[List[List[Tuple]], Dict[Tuple, List[int]]]:
+        """Get each deal's blocking keys and the ascending deal indices under every key."""
+        deal_keys = [self._blocking_keys(deal) for deal in deals]
+        
+        blocks: Dict[Tuple, List[int]] = defaultdict(list)
+        for i, keys in enumerate(deal_keys):
+            for key in keys:
+                blocks[key].append(i)
+        
+        return deal_keys, blocks
+    
+    def _later_candidates(self, i: int, keys: List[Tuple], blocks: Dict[Tuple, List[int]]) -> List[int]:
+        """List the deals after deal ``i`` that share one of its blocking keys, in order."""
+        later = set()
+        for key in keys:
+            block = blocks[key]
+            later.update(block[bisect_right(block, i):])
+        return sorted(later)
+    
+    def _has_product_attributes(self, deal: Deal) -> bool:
+        """Check if the deal has a brand, sport or category to anchor a fuzzy match."""
+        return deal.brand is not None or deal.sport is not None or deal.category is not None
+    
     def _are_duplicates(self, deal1: Deal, deal2: Deal) -> bool:
         """Check if two deals are duplicates."""
         # Check exact matches first
@@ -108,6 +152,10 @@ class DealDeduplicator:
         if deal1.category != deal2.category:
             return False
         
+        # Titles alone are too weak a signal for deals with none of the above
+        if not self._has_product_attributes(deal1):
+            return False
+        
         # Check title similarity
         title_similarity = fuzz.ratio(deal1.title.lower(), deal2.title.lower())
         if title_similarity < self.similarity_threshold * 100:
@@ -236,9 +284,11 @@ class DealDeduplicator:
     def find_duplicates(self, deals: List[Deal]) -> List[Tuple[Deal, Deal]]:
         """Find pairs of duplicate deals."""
         duplicates = []
+        deal_keys, blocks = self._build_blocks(deals)
         
         for i, deal1 in enumerate(deals):
-            for deal2 in deals[i+1:]:
+            for j in self._later_candidates(i, deal_keys[i], blocks):
+                deal2 = deals[j]
                 if self._are_duplicates(deal1, deal2):
                     duplicates.append((deal1, deal2))
         
@@ -1,5 +1,7 @@
 """Pydantic models for sports deals data validation and serialization."""
 
+import re
+import sys
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
@@ -9,6 +11,10 @@ from urllib.parse import urljoin, urlparse
 from pydantic import BaseModel, Field, HttpUrl, computed_field, field_validator
 
 
+# Youth size indicators: Y covers YS-YXXL and BOY(S), KID and GIRL cover their plurals
+_YOUTH_SIZE_RE = re.compile(r'Y|JR|JUNIOR|KID|GIRL')
+
+
 class Sport(str, Enum):
     """Supported sports categories."""
     SOCCER = "soccer"
@@ -125,7 +131,7 @@ class Deal(BaseModel):
     @classmethod
     def validate_canonical_url(cls, v: HttpUrl) -> HttpUrl:
         """Ensure canonical URL is absolute."""
-        if not v.scheme or not v.netloc:
+        if not v.scheme or not v.host:
             raise ValueError("Canonical URL must be absolute")
         return v
     
@@ -133,17 +139,23 @@ class Deal(BaseModel):
     @classmethod
     def validate_image_url(cls, v: Optional[HttpUrl]) -> Optional[HttpUrl]:
         """Ensure image URL is absolute if provided."""
-        if v and (not v.scheme or not v.netloc):
+        if v and (not v.scheme or not v.host):
             raise ValueError("Image URL must be absolute")
         return v
     
+    @field_validator('brand', 'retailer')
+    @classmethod
+    def intern_names(cls, v: Optional[str]) -> Optional[str]:
+        """Intern brand and retailer names, which repeat across many deals."""
+        return sys.intern(v) if v else v
+    
     @field_validator('sizes')
     @classmethod
     def validate_sizes(cls, v: Optional[List[str]]) -> Optional[List[str]]:
         """Clean and validate size list."""
         if v:
             # Remove empty strings and normalize
-            cleaned = [size.strip().upper() for size in v if size.strip()]
+            cleaned = [size.upper() for size in map(str.strip, v) if size]
             return cleaned if cleaned else None
         return v
     
@@ -183,17 +195,9 @@ class Deal(BaseModel):
         if not self.sizes:
             return False
         
-        # Check for youth size indicators
-        youth_indicators = {
-            'Y', 'YS', 'YM', 'YL', 'YXL', 'YXXL',  # Youth letter sizes
-            'JR', 'JUNIOR',  # Junior sizes
-            'KIDS', 'KID',  # Kids sizes
-            'BOY', 'BOYS', 'GIRL', 'GIRLS',  # Gender-specific youth
-        }
-        
-        for size in self.sizes:
-            if any(indicator in size.upper() for indicator in youth_indicators):
-                return True
+        # Check for youth size indicators in a single scan over all sizes
+        if _YOUTH_SIZE_RE.search('|'.join(self.sizes).upper()):
+            return True
         
         # Check for numeric youth sizes (typically 1-6 for shoes, etc.)
         try:
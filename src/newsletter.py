@@ -1,9 +1,10 @@
 """Newsletter generation system using Jinja2 templates."""
 
 import json
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
@@ -19,22 +20,33 @@ class NewsletterGenerator:
         self.config = config
         self.ranker = DealRanker(min_discount=config.min_discount_pct)
         
-        # Set up Jinja2 environment
+        # Share one Jinja2 environment (and its compiled templates) per template dir
         template_dir = Path(__file__).parent.parent / "templates" / "newsletter"
-        self.env = Environment(
+        self.env = self._get_environment(template_dir)
+    
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _get_environment(cls, template_dir: Path) -> Environment:
+        """Build the Jinja2 environment for a template directory."""
+        env = Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=select_autoescape(['html', 'xml'])
         )
         
         # Add custom filters
-        self.env.filters['format_price'] = self._format_price
-        self.env.filters['format_discount'] = self._format_discount
-        self.env.filters['format_date'] = self._format_date
-        self.env.filters['truncate'] = self._truncate_text
-        self.env.filters['safe_url'] = self._safe_url
+        env.filters['format_price'] = cls._format_price
+        env.filters['format_discount'] = cls._format_discount
+        env.filters['format_date'] = cls._format_date
+        env.filters['truncate'] = cls._truncate_text
+        env.filters['safe_url'] = cls._safe_url
+        
+        return env
     
     def generate_newsletter(self, deals: List[Deal], week: str) -> Dict[str, str]:
         """Generate newsletter in all configured formats."""
+        # Capture the clock once per run
+        now = datetime.now(timezone.utc)
+        
         # Filter and rank deals
         filtered_deals = self._filter_deals(deals)
         ranked_deals = self.ranker.rank_deals(filtered_deals)
@@ -43,7 +55,7 @@ class NewsletterGenerator:
         grouped_deals = self._group_deals(ranked_deals)
         
         # Prepare template context
-        context = self._prepare_context(grouped_deals, week)
+        context = self._prepare_context(grouped_deals, week, now=now)
         
         # Generate newsletters
         newsletters = {}
@@ -107,8 +119,13 @@ class NewsletterGenerator:
         
         return grouped
     
-    def _prepare_context(self, grouped_deals: Dict[str, Any], week: str) -> Dict[str, Any]:
+    def _prepare_context(
+        self, grouped_deals: Dict[str, Any], week: str, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """Prepare template context."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
         # Calculate summary statistics
         all_deals = []
         for group in grouped_deals.values():
@@ -124,7 +141,7 @@ class NewsletterGenerator:
             'title': self.config.title,
             'subtitle': self.config.subtitle,
             'week': week,
-            'generated_at': datetime.utcnow(),
+            'generated_at_str': self._format_date(now),
             'grouped_deals': grouped_deals,
             'summary': summary,
             'config': self.config,
@@ -162,25 +179,32 @@ class NewsletterGenerator:
         
         return saved_files
     
-    def _format_price(self, price: float) -> str:
+    @staticmethod
+    def _format_price(price: float) -> str:
         """Format price for display."""
         return f"${price:.2f}"
     
-    def _format_discount(self, discount: float) -> str:
+    @staticmethod
+    def _format_discount(discount: float) -> str:
         """Format discount percentage."""
         return f"{discount:.0f}%"
     
-    def _format_date(self, date: datetime) -> str:
+    @staticmethod
+    def _format_date(date: Union[datetime, str]) -> str:
         """Format date for display."""
+        if isinstance(date, str):
+            return date  # Already formatted
         return date.strftime("%B %d, %Y")
     
-    def _truncate_text(self, text: str, length: int = 100) -> str:
+    @staticmethod
+    def _truncate_text(text: str, length: int = 100) -> str:
         """Truncate text to specified length."""
         if len(text) <= length:
             return text
         return text[:length-3] + "..."
     
-    def _safe_url(self, url: str) -> str:
+    @staticmethod
+    def _safe_url(url: str) -> str:
         """Ensure URL is safe for use in templates."""
         if not url:
             return "#"
@@ -1,11 +1,13 @@
 """Deal ranking and scoring system."""
 
+import heapq
+from collections import Counter
+from operator import attrgetter
 from typing import Dict, List, Optional
 
 from .models import Deal, Sport
 from .utils.scoring import (
-    calculate_composite_score,
-    calculate_relevance_score,
+    get_cached_scores,
     rank_deals,
     get_top_deals_by_sport,
     get_top_deals_by_category,
@@ -24,17 +26,14 @@ class DealRanker:
         return rank_deals(deals, self.min_discount)
     
     def score_deals(self, deals: List[Deal]) -> List[Deal]:
-        """Calculate scores for all deals."""
+        """Calculate scores for all deals, reusing scores for unchanged deals."""
         for deal in deals:
-            deal.score = calculate_composite_score(deal)
-            deal.relevance_score = calculate_relevance_score(deal)
+            deal.score, deal.relevance_score = get_cached_scores(deal)
         return deals
     
     def get_top_deals(self, deals: List[Deal], limit: int = 50) -> List[Deal]:
         """Get top N deals by score."""
-        scored_deals = self.score_deals(deals)
-        ranked_deals = self.rank_deals(scored_deals)
-        return ranked_deals[:limit]
+        return rank_deals(deals, self.min_discount, limit=limit)
     
     def get_top_deals_by_sport(self, deals: List[Deal], top_per_sport: int = 8) -> Dict[Sport, List[Deal]]:
         """Get top deals grouped by sport."""
@@ -49,68 +48,60 @@ class DealRanker:
     def get_youth_deals(self, deals: List[Deal], limit: Optional[int] = None) -> List[Deal]:
         """Get top youth deals."""
         youth_deals = [deal for deal in deals if deal.youth_flag]
-        scored_deals = self.score_deals(youth_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(youth_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_sport(self, deals: List[Deal], sport: Sport, limit: Optional[int] = None) -> List[Deal]:
         """Get top deals for specific sport."""
         sport_deals = [deal for deal in deals if deal.sport == sport]
-        scored_deals = self.score_deals(sport_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(sport_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_category(self, deals: List[Deal], category: str, limit: Optional[int] = None) -> List[Deal]:
         """Get top deals for specific category."""
         category_deals = [deal for deal in deals if deal.category and deal.category.value == category]
-        scored_deals = self.score_deals(category_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(category_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_best_discounts(self, deals: List[Deal], limit: int = 20) -> List[Deal]:
         """Get deals with highest discount percentages."""
         deals_with_discount = [deal for deal in deals if deal.discount_pct is not None]
-        sorted_deals = sorted(deals_with_discount, key=lambda d: d.discount_pct or 0, reverse=True)
-        return sorted_deals[:limit]
+        return heapq.nlargest(limit, deals_with_discount, key=attrgetter('discount_pct'))
     
     def get_lowest_prices(self, deals: List[Deal], limit: int = 20) -> List[Deal]:
         """Get deals with lowest absolute prices."""
-        sorted_deals = sorted(deals, key=lambda d: float(d.price))
-        return sorted_deals[:limit]
+        return heapq.nsmallest(limit, deals, key=lambda d: float(d.price))
     
     def get_brand_deals(self, deals: List[Deal], brand: str, limit: Optional[int] = None) -> List[Deal]:
         """Get top deals for specific brand."""
-        brand_deals = [deal for deal in deals if deal.brand and deal.brand.lower() == brand.lower()]
-        scored_deals = self.score_deals(brand_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        brand = brand.lower()
+        brand_deals = [deal for deal in deals if deal.brand and deal.brand.lower() == brand]
+        ranked_deals = self.rank_deals(brand_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_retailer_deals(self, deals: List[Deal], retailer: str, limit: Optional[int] = None) -> List[Deal]:
         """Get top deals from specific retailer."""
-        retailer_deals = [deal for deal in deals if deal.retailer.lower() == retailer.lower()]
-        scored_deals = self.score_deals(retailer_deals)
+        retailer = retailer.lower()
+        retailer_deals = [deal for deal in deals if deal.retailer.lower() == retailer]
         ranked_deals = self.rank_deals(retailer_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_with_coupons(self, deals: List[Deal], limit: Optional[int] = None) -> List[Deal]:
         """Get deals that have coupon codes."""
         coupon_deals = [deal for deal in deals if deal.coupon_code]
-        scored_deals = self.score_deals(coupon_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(coupon_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_in_stock_deals(self, deals: List[Deal], limit: Optional[int] = None) -> List[Deal]:
         """Get deals that are in stock."""
         in_stock_deals = [deal for deal in deals if deal.in_stock is True]
-        scored_deals = self.score_deals(in_stock_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(in_stock_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_limited_stock_deals(self, deals: List[Deal], limit: Optional[int] = None) -> List[Deal]:
         """Get deals with limited stock (urgency)."""
         limited_deals = [deal for deal in deals if deal.stock_level == 'limited']
-        scored_deals = self.score_deals(limited_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(limited_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_price_range(self, deals: List[Deal], min_price: float, max_price: float, limit: Optional[int] = None) -> List[Deal]:
@@ -119,8 +110,7 @@ class DealRanker:
             deal for deal in deals 
             if min_price <= float(deal.price) <= max_price
         ]
-        scored_deals = self.score_deals(price_range_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(price_range_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_discount_range(self, deals: List[Deal], min_discount: float, max_discount: float, limit: Optional[int] = None) -> List[Deal]:
@@ -129,63 +119,52 @@ class DealRanker:
             deal for deal in deals 
             if deal.discount_pct is not None and min_discount <= deal.discount_pct <= max_discount
         ]
-        scored_deals = self.score_deals(discount_range_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(discount_range_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_size(self, deals: List[Deal], size: str, limit: Optional[int] = None) -> List[Deal]:
         """Get deals available in specific size."""
+        size = size.upper()
         size_deals = [
             deal for deal in deals 
-            if deal.sizes and size.upper() in [s.upper() for s in deal.sizes]
+            if deal.sizes and any(s.upper() == size for s in deal.sizes)
         ]
-        scored_deals = self.score_deals(size_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(size_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_age_range(self, deals: List[Deal], age_range: str, limit: Optional[int] = None) -> List[Deal]:
         """Get deals for specific age range."""
+        age_range = age_range.lower()
         age_deals = [
             deal for deal in deals 
-            if deal.age_range and age_range.lower() in deal.age_range.lower()
+            if deal.age_range and age_range in deal.age_range.lower()
         ]
-        scored_deals = self.score_deals(age_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(age_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_ending_soon(self, deals: List[Deal], limit: Optional[int] = None) -> List[Deal]:
         """Get deals that are ending soon."""
         from datetime import datetime, timedelta
         
-        ending_soon_deals = []
-        for deal in deals:
-            if deal.ends_at:
-                # Deals ending within 7 days
-                if deal.ends_at <= datetime.utcnow() + timedelta(days=7):
-                    ending_soon_deals.append(deal)
+        # Deals ending within 7 days
+        cutoff = datetime.utcnow() + timedelta(days=7)
+        ending_soon_deals = [deal for deal in deals if deal.ends_at and deal.ends_at <= cutoff]
         
-        scored_deals = self.score_deals(ending_soon_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(ending_soon_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_retailer(self, deals: List[Deal], retailers: List[str], limit: Optional[int] = None) -> List[Deal]:
         """Get deals from specific retailers."""
-        retailer_deals = [
-            deal for deal in deals 
-            if deal.retailer.lower() in [r.lower() for r in retailers]
-        ]
-        scored_deals = self.score_deals(retailer_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        wanted = {r.lower() for r in retailers}
+        retailer_deals = [deal for deal in deals if deal.retailer.lower() in wanted]
+        ranked_deals = self.rank_deals(retailer_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_brands(self, deals: List[Deal], brands: List[str], limit: Optional[int] = None) -> List[Deal]:
         """Get deals from specific brands."""
-        brand_deals = [
-            deal for deal in deals 
-            if deal.brand and deal.brand.lower() in [b.lower() for b in brands]
-        ]
-        scored_deals = self.score_deals(brand_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        wanted = {b.lower() for b in brands}
+        brand_deals = [deal for deal in deals if deal.brand and deal.brand.lower() in wanted]
+        ranked_deals = self.rank_deals(brand_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_sports(self, deals: List[Deal], sports: List[Sport], limit: Optional[int] = None) -> List[Deal]:
@@ -194,8 +173,7 @@ class DealRanker:
             deal for deal in deals 
             if deal.sport and deal.sport in sports
         ]
-        scored_deals = self.score_deals(sport_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(sport_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_categories(self, deals: List[Deal], categories: List[str], limit: Optional[int] = None) -> List[Deal]:
@@ -204,8 +182,7 @@ class DealRanker:
             deal for deal in deals 
             if deal.category and deal.category.value in categories
         ]
-        scored_deals = self.score_deals(category_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(category_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_by_multiple_criteria(
@@ -222,34 +199,23 @@ class DealRanker:
         limit: Optional[int] = None
     ) -> List[Deal]:
         """Get deals matching multiple criteria."""
-        filtered_deals = deals
-        
-        if sport:
-            filtered_deals = [deal for deal in filtered_deals if deal.sport == sport]
-        
-        if category:
-            filtered_deals = [deal for deal in filtered_deals if deal.category and deal.category.value == category]
-        
-        if brand:
-            filtered_deals = [deal for deal in filtered_deals if deal.brand and deal.brand.lower() == brand.lower()]
-        
-        if retailer:
-            filtered_deals = [deal for deal in filtered_deals if deal.retailer.lower() == retailer.lower()]
+        brand = brand.lower() if brand else None
+        retailer = retailer.lower() if retailer else None
         
-        if youth_only:
-            filtered_deals = [deal for deal in filtered_deals if deal.youth_flag]
-        
-        if in_stock_only:
-            filtered_deals = [deal for deal in filtered_deals if deal.in_stock is True]
-        
-        if min_discount is not None:
-            filtered_deals = [deal for deal in filtered_deals if deal.discount_pct is not None and deal.discount_pct >= min_discount]
-        
-        if max_price is not None:
-            filtered_deals = [deal for deal in filtered_deals if float(deal.price) <= max_price]
+        # Apply every filter in one pass, cheapest checks first
+        filtered_deals = [
+            deal for deal in deals
+            if (not sport or deal.sport == sport)
+            and (not category or (deal.category and deal.category.value == category))
+            and (not brand or (deal.brand and deal.brand.lower() == brand))
+            and (not retailer or deal.retailer.lower() == retailer)
+            and (not youth_only or deal.youth_flag)
+            and (not in_stock_only or deal.in_stock is True)
+            and (max_price is None or float(deal.price) <= max_price)
+            and (min_discount is None or (deal.discount_pct is not None and deal.discount_pct >= min_discount))
+        ]
         
-        scored_deals = self.score_deals(filtered_deals)
-        ranked_deals = self.rank_deals(scored_deals)
+        ranked_deals = self.rank_deals(filtered_deals)
         return ranked_deals[:limit] if limit else ranked_deals
     
     def get_deals_summary(self, deals: List[Deal]) -> Dict[str, any]:
@@ -258,33 +224,40 @@ class DealRanker:
             return {}
         
         total_deals = len(deals)
-        youth_deals = len([deal for deal in deals if deal.youth_flag])
-        in_stock_deals = len([deal for deal in deals if deal.in_stock is True])
-        coupon_deals = len([deal for deal in deals if deal.coupon_code])
-        
-        # Calculate average discount
-        deals_with_discount = [deal for deal in deals if deal.discount_pct is not None]
-        avg_discount = sum(deal.discount_pct for deal in deals_with_discount) / len(deals_with_discount) if deals_with_discount else 0
-        
-        # Calculate average price
-        avg_price = sum(float(deal.price) for deal in deals) / total_deals
+        youth_deals = 0
+        in_stock_deals = 0
+        coupon_deals = 0
+        discounts = []
+        prices = []
+        sport_counts = Counter()
+        brand_counts = Counter()
+        retailer_counts = Counter()
         
-        # Get top sports
-        sport_counts = {}
+        # Gather every statistic in a single pass over the deals
         for deal in deals:
+            if deal.youth_flag:
+                youth_deals += 1
+            if deal.in_stock is True:
+                in_stock_deals += 1
+            if deal.coupon_code:
+                coupon_deals += 1
+            
+            discount = deal.discount_pct
+            if discount is not None:
+                discounts.append(discount)
+            
+            prices.append(float(deal.price))
+            
             if deal.sport:
-                sport_counts[deal.sport.value] = sport_counts.get(deal.sport.value, 0) + 1
-        
-        # Get top brands
-        brand_counts = {}
-        for deal in deals:
+                sport_counts[deal.sport.value] += 1
             if deal.brand:
-                brand_counts[deal.brand] = brand_counts.get(deal.brand, 0) + 1
+                brand_counts[deal.brand] += 1
+            retailer_counts[deal.retailer] += 1
         
-        # Get top retailers
-        retailer_counts = {}
-        for deal in deals:
-            retailer_counts[deal.retailer] = retailer_counts.get(deal.retailer, 0) + 1
+        # Total with sum() rather than running +=, which rounds differently
+        # from sum()'s compensated float summation on Python 3.12+
+        avg_discount = sum(discounts) / len(discounts) if discounts else 0
+        avg_price = sum(prices) / total_deals
         
         return {
             'total_deals': total_deals,
@@ -293,7 +266,7 @@ class DealRanker:
             'coupon_deals': coupon_deals,
             'avg_discount': round(avg_discount, 1),
             'avg_price': round(avg_price, 2),
-            'top_sports': sorted(sport_counts.items(), key=lambda x: x[1], reverse=True)[:5],
-            'top_brands': sorted(brand_counts.items(), key=lambda x: x[1], reverse=True)[:5],
-            'top_retailers': sorted(retailer_counts.items(), key=lambda x: x[1], reverse=True)[:5],
+            'top_sports': sport_counts.most_common(5),
+            'top_brands': brand_counts.most_common(5),
+            'top_retailers': retailer_counts.most_common(5),
         }
@@ -2,35 +2,87 @@
 
 import re
 from decimal import Decimal, InvalidOperation
+from html import unescape
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin, urlparse
 
 import json
 from selectolax.parser import HTMLParser
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+
+# Precompiled patterns shared by the parsing helpers
+_WHITESPACE_RE = re.compile(r'\s+')
+_CURRENCY_RE = re.compile(r'[$£€¥]')
+_PRICE_PREFIX_RE = re.compile(r'(?:price|cost|was|now|sale):\s*', re.IGNORECASE)
+_PRICE_NUMBER_RE = re.compile(r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)')
+
+_BRAND_PATTERNS = [
+    re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'),  # Title case words at start
+    re.compile(r'([A-Z][A-Z]+)'),  # All caps (Nike, Adidas, etc.)
+    re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+'),  # Title case followed by space
+]
+
+# Letter and numeric size tokens in one scan. Youth (YS, YM), junior (JR) and
+# kids (KIDS, BOY, GIRL) sizes are letter tokens, so they need no pattern of their own.
+_SIZE_TOKEN_RE = re.compile(r'\b([A-Z]+\d*|\d+(?:\.\d+)?)\b', re.IGNORECASE)
+_SIZE_RANGE_RE = re.compile(r'\b(\d+-\d+)\b')  # Size ranges (10-12, etc.)
+
+_SKU_PREFIX_RE = re.compile(r'^(sku|item|product)[:\s]*', re.IGNORECASE)
+_SKU_RE = re.compile(r'^[A-Za-z0-9\-_\.]+$')
+
+_COUPON_PATTERNS = [
+    re.compile(r'(?:code|coupon)[:\s]*([A-Z0-9]{3,20})', re.IGNORECASE),
+    re.compile(r'([A-Z0-9]{3,20})(?:\s+off|\s+discount)', re.IGNORECASE),
+    re.compile(r'save\s+([A-Z0-9]{3,20})', re.IGNORECASE),
+    re.compile(r'use\s+code\s+([A-Z0-9]{3,20})', re.IGNORECASE),
+]
+
+# Only JSON-LD scripts capture a body. Other scripts and HTML comments are
+# consumed whole with an empty group, so commented-out JSON-LD is skipped and a
+# "<!--" inside some other script's code cannot swallow the blocks after it
+_JSON_LD_RE = re.compile(
+    r'<script\b[^>]*(?<![-\w])type\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>'
+    r'|<script\b[^>]*>.*?</script\s*>'
+    r'|<!--.*?-->',
+    re.IGNORECASE | re.DOTALL,
+)
+_JSON_LD_BYTES_RE = re.compile(_JSON_LD_RE.pattern.encode(), re.IGNORECASE | re.DOTALL)
+
+# Plain substring alternations, matching the original keyword scans ("womens" hits "men")
+_YOUTH_KEYWORDS_RE = re.compile(
+    r'youth|jr|junior|kids|kid|boy|boys|girl|girls'
+    r'|child|children|toddler|infant|baby|little|small'
+    r'|ys|ym|yl|yxl|yxxl'  # Youth size codes
+)
+_ADULT_KEYWORDS_RE = re.compile(
+    r'adult|men|mens|women|womens|man|woman'
+    r'|grown|mature|senior'
+)
+
+_PROMOTION_END_PATTERNS = [
+    re.compile(r'ends?\s+(?:on\s+)?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)', re.IGNORECASE),
+    re.compile(r'expires?\s+(?:on\s+)?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)', re.IGNORECASE),
+    re.compile(r'valid\s+until\s+(\w+\s+\d{1,2}(?:st|nd|rd|th)?)', re.IGNORECASE),
+    re.compile(r'through\s+(\w+\s+\d{1,2}(?:st|nd|rd|th)?)', re.IGNORECASE),
+]
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text content."""
     if not text:
         return ""
     
-    # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # Remove common HTML entities
-    html_entities = {
-        '&amp;': '&',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&quot;': '"',
-        '&apos;': "'",
-        '&nbsp;': ' ',
-    }
-    
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
+    # Decode HTML entities (named and numeric) first, so encoded whitespace
+    # such as &#10; or &nbsp; is collapsed along with the literal whitespace
+    text = unescape(text)
     
-    return text
+    # Remove extra whitespace and normalize
+    return _WHITESPACE_RE.sub(' ', text).strip()
 
 
 def parse_price(price_text: str) -> Optional[Decimal]:
@@ -42,11 +94,11 @@ def parse_price(price_text: str) -> Optional[Decimal]:
     price_text = clean_text(price_text)
     
     # Remove currency symbols and common prefixes
-    price_text = re.sub(r'[$£€¥]', '', price_text)
-    price_text = re.sub(r'(?:price|cost|was|now|sale):\s*', '', price_text, flags=re.IGNORECASE)
+    price_text = _CURRENCY_RE.sub('', price_text)
+    price_text = _PRICE_PREFIX_RE.sub('', price_text)
     
     # Extract numeric value with optional decimal
-    price_match = re.search(r'(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', price_text)
+    price_match = _PRICE_NUMBER_RE.search(price_text)
     if not price_match:
         return None
     
@@ -85,15 +137,8 @@ def extract_brand_from_title(title: str) -> Optional[str]:
     
     title = clean_text(title)
     
-    # Common brand patterns
-    brand_patterns = [
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',  # Title case words at start
-        r'([A-Z][A-Z]+)',  # All caps (Nike, Adidas, etc.)
-        r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+',  # Title case followed by space
-    ]
-    
-    for pattern in brand_patterns:
-        match = re.search(pattern, title)
+    for pattern in _BRAND_PATTERNS:
+        match = pattern.search(title)
         if match:
             brand = match.group(1).strip()
             # Filter out common non-brand words
@@ -110,20 +155,8 @@ def parse_sizes(size_text: str) -> List[str]:
     
     size_text = clean_text(size_text)
     
-    # Common size patterns
-    size_patterns = [
-        r'\b([A-Z]+\d*)\b',  # Letter sizes (S, M, L, XL, etc.)
-        r'\b(\d+(?:\.\d+)?)\b',  # Numeric sizes
-        r'\b(Y[A-Z]+)\b',  # Youth sizes (YS, YM, YL, etc.)
-        r'\b(JR|JUNIOR)\b',  # Junior sizes
-        r'\b(KIDS?|BOY|GIRL)\b',  # Kids sizes
-        r'\b(\d+-\d+)\b',  # Size ranges (10-12, etc.)
-    ]
-    
-    sizes = []
-    for pattern in size_patterns:
-        matches = re.findall(pattern, size_text, re.IGNORECASE)
-        sizes.extend(matches)
+    sizes = _SIZE_TOKEN_RE.findall(size_text)
+    sizes.extend(_SIZE_RANGE_RE.findall(size_text))
     
     # Remove duplicates and normalize
     unique_sizes = list(set(size.upper() for size in sizes))
@@ -171,37 +204,42 @@ def detect_youth_keywords(text: str) -> bool:
     
     text = clean_text(text).lower()
     
-    youth_keywords = [
-        'youth', 'jr', 'junior', 'kids', 'kid', 'boy', 'boys', 'girl', 'girls',
-        'child', 'children', 'toddler', 'infant', 'baby', 'little', 'small',
-        'ys', 'ym', 'yl', 'yxl', 'yxxl',  # Youth size codes
-    ]
-    
-    adult_keywords = [
-        'adult', 'men', 'mens', 'women', 'womens', 'man', 'woman',
-        'grown', 'mature', 'senior',
-    ]
-    
     # Check for adult keywords first (strong negative signal)
-    if any(keyword in text for keyword in adult_keywords):
+    if _ADULT_KEYWORDS_RE.search(text):
         return False
     
     # Check for youth keywords
-    return any(keyword in text for keyword in youth_keywords)
+    return _YOUTH_KEYWORDS_RE.search(text) is not None
 
 
-def extract_json_ld(html: str) -> List[Dict[str, Any]]:
-    """Extract JSON-LD structured data from HTML."""
+def extract_json_ld(html: Union[str, bytes]) -> List[Dict[str, Any]]:
+    """Extract JSON-LD structured data from HTML (text or raw response bytes)."""
     if not html:
         return []
     
-    parser = HTMLParser(html)
-    json_ld_scripts = parser.css('script[type="application/ld+json"]')
+    # Pull script bodies with a single regex pass instead of building a DOM;
+    # bytes are scanned as-is and handed straight to the JSON parser
+    if isinstance(html, bytes):
+        matches = _JSON_LD_BYTES_RE.findall(html)
+        has_json_ld = b'ld+json' in html
+    else:
+        matches = _JSON_LD_RE.findall(html)
+        has_json_ld = 'ld+json' in html
+    
+    # Comments and empty scripts come back as empty bodies
+    script_bodies = [body for body in matches if body]
+    
+    if not script_bodies and has_json_ld:
+        # Unusual markup the regex missed; fall back to the full parser
+        parser = HTMLParser(html)
+        script_bodies = [
+            script.text() for script in parser.css('script[type="application/ld+json"]')
+        ]
     
     json_ld_data = []
-    for script in json_ld_scripts:
+    for script_body in script_bodies:
         try:
-            data = json.loads(script.text())
+            data = _json_loads(script_body)
             if isinstance(data, list):
                 json_ld_data.extend(data)
             else:
@@ -304,10 +342,10 @@ def clean_sku(sku: str) -> Optional[str]:
     sku = clean_text(sku).strip()
     
     # Remove common prefixes
-    sku = re.sub(r'^(sku|item|product)[:\s]*', '', sku, flags=re.IGNORECASE)
+    sku = _SKU_PREFIX_RE.sub('', sku)
     
     # Must be alphanumeric with some special chars
-    if re.match(r'^[A-Za-z0-9\-_\.]+$', sku) and len(sku) >= 2:
+    if _SKU_RE.match(sku) and len(sku) >= 2:
         return sku.upper()
     
     return None
@@ -320,16 +358,8 @@ def extract_coupon_code(text: str) -> Optional[str]:
     
     text = clean_text(text)
     
-    # Common coupon patterns
-    coupon_patterns = [
-        r'(?:code|coupon)[:\s]*([A-Z0-9]{3,20})',
-        r'([A-Z0-9]{3,20})(?:\s+off|\s+discount)',
-        r'save\s+([A-Z0-9]{3,20})',
-        r'use\s+code\s+([A-Z0-9]{3,20})',
-    ]
-    
-    for pattern in coupon_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _COUPON_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1).upper()
     
@@ -343,16 +373,8 @@ def parse_promotion_end(text: str) -> Optional[str]:
     
     text = clean_text(text)
     
-    # Common end date patterns
-    end_patterns = [
-        r'ends?\s+(?:on\s+)?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)',
-        r'expires?\s+(?:on\s+)?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)',
-        r'valid\s+until\s+(\w+\s+\d{1,2}(?:st|nd|rd|th)?)',
-        r'through\s+(\w+\s+\d{1,2}(?:st|nd|rd|th)?)',
-    ]
-    
-    for pattern in end_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _PROMOTION_END_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1)
     
@@ -1,7 +1,11 @@
 """Scoring utilities for ranking deals by quality and relevance."""
 
+import heapq
+import re
+import threading
+from collections import OrderedDict, defaultdict
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..models import Deal, Sport
 
@@ -27,15 +31,11 @@ BRAND_SCORES: Dict[str, float] = {
     'SHER-WOOD': 6.5, # Hockey
     'EASTON': 7.0,  # Baseball/Hockey
     'RAWLINGS': 7.0, # Baseball
-    'WILSON': 6.5,  # Baseball
     'LOUISVILLE': 6.5, # Baseball
     'MOLTEN': 6.0,  # Basketball
     'SPALDING': 6.0, # Basketball
     
-    # Soccer brands
-    'ADIDAS': 8.0,
-    'NIKE': 8.5,
-    'PUMA': 7.0,
+    # Soccer brands (ADIDAS, NIKE and PUMA are listed with the premium brands)
     'UMBRO': 6.5,
     'KAPPA': 6.0,
     'DIADORA': 6.0,
@@ -88,17 +88,32 @@ SPORT_BRAND_BONUSES: Dict[Sport, Dict[str, float]] = {
     },
 }
 
+# Final brand score per sport and brand, with the sport bonuses and cap folded in
+_BRAND_SCORE_BY_SPORT: Dict[Optional[Sport], Dict[str, float]] = {}
+for _sport in [None, *Sport]:
+    _bonuses = SPORT_BRAND_BONUSES.get(_sport, {})
+    _BRAND_SCORE_BY_SPORT[_sport] = {
+        brand: min(10.0, BRAND_SCORES.get(brand, 5.0) + _bonuses.get(brand, 0.0))
+        for brand in BRAND_SCORES.keys() | _bonuses.keys()
+    }
+del _sport, _bonuses
+
+# Substring keyword checks used by the youth score, one regex scan each
+_YOUTH_SIZE_RE = re.compile(r'Y|JR|JUNIOR|KIDS|BOY|GIRL')
+_YOUTH_TITLE_RE = re.compile(r'youth|jr|junior|kids|boy|girl|child')
+_ADULT_TITLE_RE = re.compile(r'adult|men|mens|women|womens')
+
 
 def calculate_discount_score(deal: Deal) -> float:
     """Calculate discount-based score (0-45 points)."""
-    if not deal.discount_pct:
+    # discount_pct is computed from price and MSRP on every access, so read it once
+    discount_pct = deal.discount_pct
+    if not discount_pct:
         return 0.0
     
     # Cap at 45 points, with diminishing returns for very high discounts
-    discount_pct = min(deal.discount_pct, 90)  # Cap at 90% to avoid fake MSRPs
+    discount_pct = min(discount_pct, 90)  # Cap at 90% to avoid fake MSRPs
     
-    # Use logarithmic scaling for diminishing returns
-    import math
     score = min(45, discount_pct * 0.9)
     
     # Bonus for very high discounts (70%+)
@@ -146,8 +161,7 @@ def calculate_youth_score(deal: Deal) -> float:
         total_sizes = len(deal.sizes)
         
         for size in deal.sizes:
-            size_upper = size.upper()
-            if any(keyword in size_upper for keyword in ['Y', 'JR', 'JUNIOR', 'KIDS', 'BOY', 'GIRL']):
+            if _YOUTH_SIZE_RE.search(size.upper()):
                 youth_sizes += 1
         
         if youth_sizes > 0:
@@ -156,13 +170,11 @@ def calculate_youth_score(deal: Deal) -> float:
     
     # Title/keyword analysis
     title_lower = deal.title.lower()
-    youth_keywords = ['youth', 'jr', 'junior', 'kids', 'boy', 'girl', 'child']
-    adult_keywords = ['adult', 'men', 'mens', 'women', 'womens']
     
-    if any(keyword in title_lower for keyword in youth_keywords):
+    if _YOUTH_TITLE_RE.search(title_lower):
         score += 3.0
     
-    if any(keyword in title_lower for keyword in adult_keywords):
+    if _ADULT_TITLE_RE.search(title_lower):
         score -= 5.0  # Strong negative signal
     
     # Age range bonus
@@ -177,15 +189,10 @@ def calculate_brand_score(deal: Deal) -> float:
     if not deal.brand:
         return 0.0
     
-    brand_upper = deal.brand.upper().strip()
-    base_score = BRAND_SCORES.get(brand_upper, 5.0)  # Default to middle score
-    
-    # Add sport-specific bonus
-    if deal.sport and deal.sport in SPORT_BRAND_BONUSES:
-        sport_bonus = SPORT_BRAND_BONUSES[deal.sport].get(brand_upper, 0.0)
-        base_score += sport_bonus
+    brand_scores = _BRAND_SCORE_BY_SPORT.get(deal.sport) or _BRAND_SCORE_BY_SPORT[None]
     
-    return min(10.0, base_score)
+    # Unknown brands default to the middle score
+    return brand_scores.get(deal.brand.upper().strip(), 5.0)
 
 
 def calculate_inventory_score(deal: Deal) -> float:
@@ -218,7 +225,15 @@ def calculate_inventory_score(deal: Deal) -> float:
 
 
 def calculate_composite_score(deal: Deal) -> float:
-    """Calculate overall composite score (0-100 points)."""
+    """Calculate overall composite score (0-100 points).
+    
+    Results are memoized by the deal's score-affecting content.
+    """
+    return get_cached_scores(deal)[0]
+
+
+def _compute_composite_score(deal: Deal) -> float:
+    """Compute the composite score from the individual sub-scores."""
     discount_score = calculate_discount_score(deal)
     price_score = calculate_price_score(deal)
     youth_score = calculate_youth_score(deal)
@@ -261,64 +276,120 @@ def calculate_relevance_score(deal: Deal, target_sport: Optional[Sport] = None)
     return min(100.0, score)
 
 
-def rank_deals(deals: List[Deal], min_discount: float = 0.0) -> List[Deal]:
-    """Rank deals by composite score and filter by minimum discount."""
-    # Calculate scores for all deals
+# (composite, relevance) scores keyed by score-affecting deal content, kept in
+# least-recently-used order. The cache lives for the whole process and persists
+# across ranking runs; call clear_score_cache() to reset it.
+_SCORE_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[float, float]]" = OrderedDict()
+_SCORE_CACHE_LOCK = threading.Lock()
+_SCORE_CACHE_MAX_SIZE = 100_000
+
+
+def _score_cache_key(deal: Deal) -> Tuple[Any, ...]:
+    """Build a cache key from every field that feeds the composite and relevance scores."""
+    return (
+        deal.title,
+        deal.brand,
+        deal.sport,
+        deal.category,
+        deal.youth_flag,
+        tuple(deal.sizes) if deal.sizes else None,
+        deal.age_range,
+        deal.price,
+        deal.msrp,
+        deal.in_stock,
+        deal.stock_level,
+        deal.coupon_code,
+    )
+
+
+def get_cached_scores(deal: Deal) -> Tuple[float, float]:
+    """Return (composite, relevance) scores, reusing results for unchanged deal content.
+    
+    The key is a snapshot of the deal's score inputs, so editing a deal simply
+    misses the old entry. Once full, the least recently used entry is evicted.
+    """
+    key = _score_cache_key(deal)
+    with _SCORE_CACHE_LOCK:
+        scores = _SCORE_CACHE.get(key)
+        if scores is not None:
+            _SCORE_CACHE.move_to_end(key)
+            return scores
+    
+    scores = (_compute_composite_score(deal), calculate_relevance_score(deal))
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE[key] = scores
+        if len(_SCORE_CACHE) > _SCORE_CACHE_MAX_SIZE:
+            _SCORE_CACHE.popitem(last=False)
+    return scores
+
+
+def clear_score_cache() -> None:
+    """Drop all cached deal scores."""
+    with _SCORE_CACHE_LOCK:
+        _SCORE_CACHE.clear()
+
+
+def _deal_score(deal: Deal) -> float:
+    """Sort key for ranking: the deal's composite score, with unscored deals last."""
+    return deal.score or 0
+
+
+def rank_deals(
+    deals: List[Deal],
+    min_discount: float = 0.0,
+    limit: Optional[int] = None,
+) -> List[Deal]:
+    """Rank deals by composite score and filter by minimum discount.
+    
+    Only deals that pass the discount filter are scored. Deals below
+    ``min_discount`` are left untouched: their ``score`` and ``relevance_score``
+    stay ``None`` or keep whatever stale values they already had. Pass
+    ``limit`` to select only the top N deals instead of sorting the full list.
+    """
+    # Filter by minimum discount, scoring only the deals that pass
+    ranked_deals = []
     for deal in deals:
-        deal.score = calculate_composite_score(deal)
-        deal.relevance_score = calculate_relevance_score(deal)
-    
-    # Filter by minimum discount
-    filtered_deals = [
-        deal for deal in deals 
-        if deal.discount_pct is None or deal.discount_pct >= min_discount
-    ]
+        discount = deal.discount_pct
+        if discount is not None and discount < min_discount:
+            continue
+        deal.score, deal.relevance_score = get_cached_scores(deal)
+        ranked_deals.append(deal)
     
     # Sort by composite score (descending)
-    ranked_deals = sorted(filtered_deals, key=lambda d: d.score or 0, reverse=True)
+    if limit is not None:
+        return heapq.nlargest(limit, ranked_deals, key=_deal_score)
+    ranked_deals.sort(key=_deal_score, reverse=True)
     
     return ranked_deals
 
 
 def get_top_deals_by_sport(deals: List[Deal], top_per_sport: int = 8) -> Dict[Sport, List[Deal]]:
     """Get top deals grouped by sport."""
-    sport_deals: Dict[Sport, List[Deal]] = {}
+    sport_deals: Dict[Sport, List[Deal]] = defaultdict(list)
     
     # Group deals by sport
     for deal in deals:
         if deal.sport:
-            if deal.sport not in sport_deals:
-                sport_deals[deal.sport] = []
             sport_deals[deal.sport].append(deal)
     
-    # Sort each sport's deals and take top N
-    for sport in sport_deals:
-        sport_deals[sport] = sorted(
-            sport_deals[sport], 
-            key=lambda d: d.score or 0, 
-            reverse=True
-        )[:top_per_sport]
-    
-    return sport_deals
+    # Keep the top N deals per sport
+    return {
+        sport: heapq.nlargest(top_per_sport, group, key=_deal_score)
+        for sport, group in sport_deals.items()
+    }
 
 
 def get_top_deals_by_category(deals: List[Deal], top_per_category: int = 5) -> Dict[str, List[Deal]]:
     """Get top deals grouped by category."""
-    category_deals: Dict[str, List[Deal]] = {}
+    category_deals: Dict[str, List[Deal]] = defaultdict(list)
     
     # Group deals by category
     for deal in deals:
         category = deal.category.value if deal.category else "other"
-        if category not in category_deals:
-            category_deals[category] = []
         category_deals[category].append(deal)
     
-    # Sort each category's deals and take top N
-    for category in category_deals:
-        category_deals[category] = sorted(
-            category_deals[category],
-            key=lambda d: d.score or 0,
-            reverse=True
-        )[:top_per_category]
-    
-    return category_deals
+    # Keep the top N deals per category
+    return {
+        category: heapq.nlargest(top_per_category, group, key=_deal_score)
+        for category, group in category_deals.items()
+    }
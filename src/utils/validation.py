@@ -1,17 +1,65 @@
 """Validation utilities for data integrity and configuration validation."""
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from ..models import RetailerConfig
 
 
+# Luhn contribution of a doubled digit, indexed by the digit
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+# Precompiled patterns shared by the validators
+_HTTP_NETLOC_RE = re.compile(r'https?://([^/?#\[\]\t\r\n]*)(?=[/?#]|\Z)')
+_NON_DIGIT_RE = re.compile(r'\D')
+_MPN_RE = re.compile(r'^[A-Za-z0-9\-_\.]+$')
+
+# A run of HTML tags, control characters (except newlines and tabs) and
+# whitespace. Group 1 is set when the run holds whitespace that survives tag and
+# control-character removal, in which case the run collapses to a single space.
+_SANITIZE_RUN_RE = re.compile(
+    r'(?:<[^>]+>|[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]|([^\S\x0B\x0C\x1C-\x1F]))+'
+)
+
+# Selectors every retailer config must define
+_REQUIRED_SELECTORS = ('item', 'title', 'price')
+
+# Basic CSS selector shapes; not comprehensive but catches obvious errors
+_CSS_SELECTOR_PATTERNS = (
+    re.compile(r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*$'),  # Simple class/id/element
+    re.compile(r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*\s+[.#]?[a-zA-Z][a-zA-Z0-9_-]*$'),  # Descendant
+    re.compile(r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*\[[^]]+\]$'),  # Attribute selector
+    re.compile(r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*:[a-zA-Z-]+$'),  # Pseudo-selector
+)
+
+
 def validate_url(url: str) -> bool:
     """Validate URL format and accessibility."""
     if not url:
         return False
     
+    # The same URLs are validated repeatedly during ingest, so cache string results
+    if isinstance(url, str):
+        return _validate_url_str(url)
+    
+    return _has_scheme_and_netloc(url)
+
+
+@lru_cache(maxsize=4096)
+def _validate_url_str(url: str) -> bool:
+    """Validate a URL string, using a fast path for ordinary http(s) URLs."""
+    match = _HTTP_NETLOC_RE.match(url)
+    if match and match.group(1).isascii():
+        return bool(match.group(1))
+    
+    # Anything unusual goes through urlparse
+    return _has_scheme_and_netloc(url)
+
+
+def _has_scheme_and_netloc(url: Any) -> bool:
+    """Check that urlparse finds both a scheme and a network location."""
     try:
         parsed = urlparse(url)
         return bool(parsed.scheme and parsed.netloc)
@@ -36,13 +84,14 @@ def validate_price(price: Any) -> bool:
         return False
 
 
+@lru_cache(maxsize=2048)
 def is_valid_gtin(gtin: str) -> bool:
     """Validate GTIN (Global Trade Item Number) format."""
     if not gtin:
         return False
     
     # Remove any non-digit characters
-    digits = re.sub(r'\D', '', gtin)
+    digits = _NON_DIGIT_RE.sub('', gtin)
     
     # GTIN can be 8, 12, 13, or 14 digits
     if len(digits) not in [8, 12, 13, 14]:
@@ -60,17 +109,10 @@ def _validate_gtin_check_digit(gtin: str) -> bool:
     # Get check digit (last digit)
     check_digit = int(gtin[-1])
     
-    # Calculate expected check digit
-    digits = [int(d) for d in gtin[:-1]]
-    
-    # Apply Luhn algorithm
-    total = 0
-    for i, digit in enumerate(reversed(digits)):
-        if i % 2 == 0:  # Even positions (0-indexed)
-            doubled = digit * 2
-            total += doubled if doubled < 10 else doubled - 9
-        else:  # Odd positions
-            total += digit
+    # Apply Luhn algorithm: walking right to left from the digit before the
+    # check digit, every other digit is doubled (minus 9 when above 9)
+    total = sum(_LUHN_DOUBLED[int(d)] for d in gtin[-2::-2])
+    total += sum(int(d) for d in gtin[-3::-2])
     
     expected_check = (10 - (total % 10)) % 10
     return check_digit == expected_check
@@ -83,9 +125,7 @@ def is_valid_mpn(mpn: str) -> bool:
     
     # MPN should be alphanumeric with some special characters
     # Common patterns: letters, numbers, hyphens, underscores, dots
-    mpn_pattern = r'^[A-Za-z0-9\-_\.]+$'
-    
-    if not re.match(mpn_pattern, mpn):
+    if not _MPN_RE.match(mpn):
         return False
     
     # Should be reasonable length (2-50 characters)
@@ -108,18 +148,20 @@ def validate_retailer_config(config: RetailerConfig) -> List[str]:
         errors.append("Invalid base URL format")
     
     # Validate selectors
-    required_selectors = ['item', 'title', 'price']
-    for selector in required_selectors:
-        if selector not in config.selectors:
+    selectors = config.selectors
+    for selector in _REQUIRED_SELECTORS:
+        value = selectors.get(selector)
+        if value is None:
             errors.append(f"Missing required selector: {selector}")
-        elif not config.selectors[selector].strip():
+        elif not value.strip():
             errors.append(f"Empty selector: {selector}")
     
     # Validate rate limits
-    if config.rate_limit.get('requests_per_minute', 0) <= 0:
+    rate_limit = config.rate_limit
+    if rate_limit.get('requests_per_minute', 0) <= 0:
         errors.append("requests_per_minute must be positive")
     
-    if config.rate_limit.get('burst', 0) <= 0:
+    if rate_limit.get('burst', 0) <= 0:
         errors.append("burst must be positive")
     
     # Validate pagination if provided
@@ -256,19 +298,18 @@ def validate_newsletter_config(config_data: Dict[str, Any]) -> List[str]:
     return errors
 
 
+def _collapse_sanitize_run(match: re.Match) -> str:
+    """Replace a tag/control/whitespace run with a space if it held whitespace."""
+    return ' ' if match.group(1) is not None else ''
+
+
 def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     """Sanitize text by removing dangerous characters and limiting length."""
     if not text:
         return ""
     
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    # Remove control characters except newlines and tabs
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
-    
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    # Remove HTML tags and control characters and normalize whitespace in one pass
+    text = _SANITIZE_RUN_RE.sub(_collapse_sanitize_run, text).strip()
     
     # Limit length if specified
     if max_length and len(text) > max_length:
@@ -283,15 +324,8 @@ def validate_css_selector(selector: str) -> bool:
         return False
     
     # Basic validation - check for common CSS selector patterns
-    # This is not comprehensive but catches obvious errors
-    valid_patterns = [
-        r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*$',  # Simple class/id/element
-        r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*\s+[.#]?[a-zA-Z][a-zA-Z0-9_-]*$',  # Descendant
-        r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*\[[^]]+\]$',  # Attribute selector
-        r'^[.#]?[a-zA-Z][a-zA-Z0-9_-]*:[a-zA-Z-]+$',  # Pseudo-selector
-    ]
-    
-    return any(re.match(pattern, selector.strip()) for pattern in valid_patterns)
+    selector = selector.strip()
+    return any(pattern.match(selector) for pattern in _CSS_SELECTOR_PATTERNS)
 
 
 def validate_xpath_selector(xpath: str) -> bool:
@@ -0,0 +1,25 @@
+"""Test helpers for building deals from trusted literal data."""
+
+from decimal import Decimal
+from typing import Any
+
+from src.models import Currency, Deal
+
+
+_DEAL_DEFAULTS = {
+    "id": "test-deal",
+    "title": "Test Product",
+    "price": Decimal("50.00"),
+    "currency": Currency.USD,
+    "retailer": "Test",
+    "canonical_url": "https://example.com/product",
+}
+
+
+def make_deal(**overrides: Any) -> Deal:
+    """Build a Deal without running pydantic validation.
+    
+    Use this only for tests that do not exercise validation. Field validators
+    are skipped, so pass sizes already normalized to upper case.
+    """
+    return Deal.model_construct(**{**_DEAL_DEFAULTS, **overrides})
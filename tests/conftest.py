@@ -1,16 +1,27 @@
 """Pytest configuration and fixtures."""
 
+import copy
+
 import pytest
 from decimal import Decimal
 from datetime import datetime
 from pathlib import Path
 
-from src.models import Deal, Sport, Category, Currency
+from src.models import Deal, Sport, Category, Currency, NewsletterConfig
+from src.ranker import DealRanker
+from src.utils.scoring import calculate_composite_score, clear_score_cache
 
 
-@pytest.fixture
-def sample_deal():
-    """Create a sample deal for testing."""
+@pytest.fixture(scope="session", autouse=True)
+def _score_cache():
+    """Drop memoized deal scores once the test session is over."""
+    yield
+    clear_score_cache()
+
+
+@pytest.fixture(scope="session")
+def _sample_deal():
+    """Build the sample deal once per session."""
     return Deal(
         id="test-deal-1",
         title="Nike Youth Soccer Cleats",
@@ -31,8 +42,14 @@ def sample_deal():
 
 
 @pytest.fixture
-def sample_deals():
-    """Create multiple sample deals for testing."""
+def sample_deal(_sample_deal):
+    """Create a sample deal for testing."""
+    return copy.deepcopy(_sample_deal)
+
+
+@pytest.fixture(scope="session")
+def _sample_deals():
+    """Build the sample deals once per session."""
     return [
         Deal(
             id="deal-1",
@@ -88,6 +105,51 @@ def sample_deals():
     ]
 
 
+@pytest.fixture
+def sample_deals(_sample_deals):
+    """Create multiple sample deals for testing."""
+    return copy.deepcopy(_sample_deals)
+
+
+@pytest.fixture(scope="session")
+def _scored_sample_deals(_sample_deals):
+    """Score a copy of the sample deals once per session."""
+    deals = copy.deepcopy(_sample_deals)
+    for deal in deals:
+        deal.score = calculate_composite_score(deal)
+    return deals
+
+
+@pytest.fixture
+def scored_sample_deals(_scored_sample_deals):
+    """Sample deals with composite scores already assigned."""
+    return copy.deepcopy(_scored_sample_deals)
+
+
+@pytest.fixture(scope="session")
+def ranker_20():
+    """Shared ranker with a 20% minimum discount."""
+    return DealRanker(min_discount=20.0)
+
+
+@pytest.fixture(scope="session")
+def newsletter_config_factory(tmp_path_factory):
+    """Build newsletter configs that differ only by title and output directory."""
+    default_output_dir = tmp_path_factory.mktemp("newsletter")
+    
+    def _make(title, output_dir=None):
+        return NewsletterConfig(
+            title=title,
+            top_per_sport=2,
+            min_discount_pct=20.0,
+            show_youth_only=True,
+            formats=["html", "markdown"],
+            output_dir=str(output_dir or default_output_dir)
+        )
+    
+    return _make
+
+
 @pytest.fixture
 def sample_html():
     """Sample HTML for testing parsers."""
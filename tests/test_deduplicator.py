@@ -0,0 +1,44 @@
+"""Tests for the deal deduplicator."""
+
+from decimal import Decimal
+
+from src.deduplicator import DealDeduplicator
+from src.models import Category, Sport
+from tests._factories import make_deal
+
+
+def test_fuzzy_duplicates_need_product_attributes():
+    """Test that similar titles only merge when brand, sport or category anchor them."""
+    deduplicator = DealDeduplicator()
+    
+    labelled = [
+        make_deal(id="a", title="Nike Youth Soccer Cleats", brand="Nike", sport=Sport.SOCCER),
+        make_deal(id="b", title="Nike Youth Soccer Cleat", brand="Nike", sport=Sport.SOCCER),
+    ]
+    groups = deduplicator.get_duplicate_groups(labelled)
+    assert [[deal.id for deal in group] for group in groups] == [["a", "b"]]
+    
+    unlabelled = [
+        make_deal(id="c", title="Youth Soccer Cleats"),
+        make_deal(id="d", title="Youth Soccer Cleat"),
+    ]
+    groups = deduplicator.get_duplicate_groups(unlabelled)
+    assert [[deal.id for deal in group] for group in groups] == [["c"], ["d"]]
+
+
+def test_identifier_duplicates_across_blocks():
+    """Test that shared identifiers merge deals whatever their titles and labels."""
+    deduplicator = DealDeduplicator()
+    deals = [
+        make_deal(id="a", title="Shin Guards", gtin="00012345678905"),
+        make_deal(id="b", title="Ball", brand="Adidas", category=Category.EQUIPMENT),
+        make_deal(id="c", title="Youth Shin Guards", brand="Nike", gtin="00012345678905"),
+        make_deal(id="d", title="Ball Pump", mpn="BP-1", price=Decimal("10.00")),
+        make_deal(id="e", title="Pump", mpn="BP-1", price=Decimal("20.00")),
+    ]
+    
+    groups = deduplicator.get_duplicate_groups(deals)
+    assert [[deal.id for deal in group] for group in groups] == [["a", "c"], ["b"], ["d", "e"]]
+    
+    pairs = deduplicator.find_duplicates(deals)
+    assert [(deal1.id, deal2.id) for deal1, deal2 in pairs] == [("a", "c"), ("d", "e")]
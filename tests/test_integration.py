@@ -3,15 +3,16 @@
 import pytest
 from pathlib import Path
 
-from src.models import Deal, NewsletterConfig
-from src.ranker import DealRanker
+from src.models import Deal
 from src.deduplicator import DealDeduplicator
 from src.newsletter import NewsletterGenerator
 
+pytestmark = pytest.mark.integration
 
-def test_ranker_integration(sample_deals):
+
+def test_ranker_integration(sample_deals, ranker_20):
     """Test ranker integration with sample deals."""
-    ranker = DealRanker(min_discount=20.0)
+    ranker = ranker_20
     
     # Test ranking
     ranked_deals = ranker.rank_deals(sample_deals)
@@ -51,16 +52,9 @@ def test_deduplicator_integration(sample_deals):
     assert "duplicate_groups" in stats
 
 
-def test_newsletter_generation_integration(sample_deals):
+def test_newsletter_generation_integration(sample_deals, newsletter_config_factory):
     """Test newsletter generation integration."""
-    config = NewsletterConfig(
-        title="Test Newsletter",
-        top_per_sport=2,
-        min_discount_pct=20.0,
-        show_youth_only=True,
-        formats=["html", "markdown"],
-        output_dir="test_out"
-    )
+    config = newsletter_config_factory("Test Newsletter")
     
     generator = NewsletterGenerator(config)
     
@@ -82,25 +76,17 @@ def test_newsletter_generation_integration(sample_deals):
     assert "Week 2025-W01" in markdown_content
 
 
-def test_end_to_end_workflow(sample_deals):
+def test_end_to_end_workflow(sample_deals, ranker_20, newsletter_config_factory):
     """Test complete end-to-end workflow."""
     # Step 1: Rank deals
-    ranker = DealRanker(min_discount=20.0)
-    ranked_deals = ranker.rank_deals(sample_deals)
+    ranked_deals = ranker_20.rank_deals(sample_deals)
     
     # Step 2: Deduplicate deals
     deduplicator = DealDeduplicator()
     canonical_deals = deduplicator.deduplicate_deals(ranked_deals)
     
     # Step 3: Generate newsletter
-    config = NewsletterConfig(
-        title="End-to-End Test Newsletter",
-        top_per_sport=2,
-        min_discount_pct=20.0,
-        show_youth_only=True,
-        formats=["html", "markdown"],
-        output_dir="test_out"
-    )
+    config = newsletter_config_factory("End-to-End Test Newsletter")
     
     generator = NewsletterGenerator(config)
     newsletters = generator.generate_newsletter(canonical_deals, "2025-W01")
@@ -111,23 +97,16 @@ def test_end_to_end_workflow(sample_deals):
     assert "html" in newsletters
     assert "markdown" in newsletters
     
-    # Check that all deals have scores
-    for deal in canonical_deals:
-        assert deal.score is not None
-        assert deal.score >= 0
-        assert deal.score <= 100
+    # Check that all deals have scores in range
+    scores = [deal.score for deal in canonical_deals]
+    assert None not in scores
+    assert min(scores, default=0) >= 0
+    assert max(scores, default=0) <= 100
 
 
-def test_newsletter_stats(sample_deals):
+def test_newsletter_stats(sample_deals, newsletter_config_factory):
     """Test newsletter statistics generation."""
-    config = NewsletterConfig(
-        title="Stats Test Newsletter",
-        top_per_sport=2,
-        min_discount_pct=20.0,
-        show_youth_only=True,
-        formats=["html", "markdown"],
-        output_dir="test_out"
-    )
+    config = newsletter_config_factory("Stats Test Newsletter")
     
     generator = NewsletterGenerator(config)
     stats = generator.get_newsletter_stats(sample_deals)
@@ -184,16 +163,10 @@ def test_deal_validation(sample_deals):
             assert deal.discount_pct <= 100
 
 
-def test_newsletter_file_generation(sample_deals, tmp_path):
+@pytest.mark.filesystem
+def test_newsletter_file_generation(sample_deals, newsletter_config_factory, tmp_path):
     """Test newsletter file generation."""
-    config = NewsletterConfig(
-        title="File Test Newsletter",
-        top_per_sport=2,
-        min_discount_pct=20.0,
-        show_youth_only=True,
-        formats=["html", "markdown"],
-        output_dir=str(tmp_path)
-    )
+    config = newsletter_config_factory("File Test Newsletter", tmp_path)
     
     generator = NewsletterGenerator(config)
     newsletters = generator.generate_newsletter(sample_deals, "2025-W01")
@@ -211,9 +184,11 @@ def test_newsletter_file_generation(sample_deals, tmp_path):
     assert html_file.exists()
     assert markdown_file.exists()
     
-    # Verify file contents
-    html_content = html_file.read_text()
-    markdown_content = markdown_file.read_text()
+    # Verify file contents match what was generated
+    html_content = html_file.read_text(encoding="utf-8")
+    markdown_content = markdown_file.read_text(encoding="utf-8")
+    assert html_content == newsletters["html"]
+    assert markdown_content == newsletters["markdown"]
     
     assert "File Test Newsletter" in html_content
     assert "File Test Newsletter" in markdown_content
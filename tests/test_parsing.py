@@ -24,6 +24,12 @@ def test_clean_text():
     # Test HTML entity replacement
     assert clean_text("Hello &amp; World") == "Hello & World"
     assert clean_text("Price &lt; $50") == "Price < $50"
+    assert clean_text("Kid&#39;s Cleats&nbsp;Sale") == "Kid's Cleats Sale"
+    
+    # Test numeric whitespace and control character entities
+    assert clean_text("Youth&#10;Cleats") == "Youth Cleats"
+    assert clean_text("&#9;Size&#13;&#10; YM&#10;") == "Size YM"
+    assert clean_text("Shin &#1;Guards") == "Shin Guards"
     
     # Test empty/None input
     assert clean_text("") == ""
@@ -127,6 +133,45 @@ def test_extract_json_ld():
     assert len(json_ld_data) == 2
     assert json_ld_data[0]["@type"] == "Product"
     assert json_ld_data[1]["@type"] == "Offer"
+    
+    assert extract_json_ld(html.encode()) == json_ld_data
+
+
+def test_extract_json_ld_skips_other_scripts():
+    """Test that JSON-LD extraction ignores lookalike and commented-out scripts."""
+    html = """
+    <script data-type="application/ld+json">{"@type": "Ignored"}</script>
+    <!-- <script type="application/ld+json">{"@type": "Commented"}</script> -->
+    <script type="application/ld+json">{"@type": "Product"}</script>
+    """
+    
+    assert extract_json_ld(html) == [{"@type": "Product"}]
+    assert extract_json_ld(html.encode()) == [{"@type": "Product"}]
+
+
+def test_extract_json_ld_after_comment_marker_in_script():
+    """Test that a "<!--" inside another script does not hide later JSON-LD."""
+    html = """
+    <script type="application/ld+json">{"@type": "Product"}</script>
+    <script>document.write("<!--");</script>
+    <script type="application/ld+json">{"@type": "Offer"}</script>
+    <!-- footer -->
+    """
+    
+    expected = [{"@type": "Product"}, {"@type": "Offer"}]
+    assert extract_json_ld(html) == expected
+    assert extract_json_ld(html.encode()) == expected
+
+
+def test_extract_json_ld_from_bytes():
+    """Test JSON-LD extraction from raw response bytes."""
+    html = '''<script type="application/ld+json">{"@type": "Product", "name": "Jr Gloves – Navy"}</script>'''
+    
+    json_ld_data = extract_json_ld(html.encode("utf-8"))
+    assert json_ld_data == [{"@type": "Product", "name": "Jr Gloves – Navy"}]
+    
+    assert extract_json_ld(b"<html><body>No structured data</body></html>") == []
+    assert extract_json_ld(b"") == []
 
 
 def test_extract_product_data_from_json_ld():
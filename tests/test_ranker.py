@@ -0,0 +1,78 @@
+"""Tests for the deal ranker."""
+
+from decimal import Decimal
+
+from src.models import Sport
+from src.ranker import DealRanker
+from tests._factories import make_deal
+
+
+def test_price_queries_after_replacing_a_deal():
+    """Test price queries when a deal in an already-queried list is replaced."""
+    ranker = DealRanker()
+    deals = [
+        make_deal(id="a", sport=Sport.SOCCER, price=Decimal("40.00")),
+        make_deal(id="b", sport=Sport.SOCCER, price=Decimal("60.00")),
+    ]
+    ranker.get_deals_by_sport(deals, Sport.SOCCER)
+    
+    # Same list object and length, different deal
+    deals[1] = make_deal(id="c", sport=Sport.SOCCER, price=Decimal("10.00"))
+    
+    lowest = ranker.get_lowest_prices(deals)
+    assert [deal.id for deal in lowest] == ["c", "a"]
+    
+    summary = ranker.get_deals_summary(deals)
+    assert summary["avg_price"] == 25.0
+
+
+def test_queries_see_in_place_edits():
+    """Test that getters reflect deals edited in place between calls."""
+    ranker = DealRanker()
+    deals = [
+        make_deal(id="a", sport=Sport.SOCCER, price=Decimal("40.00"), msrp=Decimal("100.00")),
+        make_deal(id="b", sport=Sport.SOCCER, price=Decimal("90.00"), msrp=Decimal("100.00")),
+    ]
+    
+    assert [deal.id for deal in ranker.get_deals_by_sport(deals, Sport.SOCCER)] == ["a", "b"]
+    assert [deal.id for deal in ranker.get_deals_by_price_range(deals, 0, 50)] == ["a"]
+    
+    deals[0].price = Decimal("95.00")
+    deals[1].price = Decimal("30.00")
+    
+    assert [deal.id for deal in ranker.get_deals_by_sport(deals, Sport.SOCCER)] == ["b", "a"]
+    assert [deal.id for deal in ranker.get_deals_by_price_range(deals, 0, 50)] == ["b"]
+    assert [deal.id for deal in ranker.get_deals_by_multiple_criteria(deals, max_price=50)] == ["b"]
+
+
+def test_queries_see_replaced_deals():
+    """Test that getters reflect a deal replaced without changing the list length."""
+    ranker = DealRanker()
+    deals = [
+        make_deal(id="a", sport=Sport.SOCCER, price=Decimal("40.00"), msrp=Decimal("100.00")),
+        make_deal(id="b", sport=Sport.SOCCER, price=Decimal("30.00"), msrp=Decimal("100.00")),
+    ]
+    ranker.get_deals_by_sport(deals, Sport.SOCCER)
+    
+    deals[0] = make_deal(id="c", sport=Sport.BASKETBALL, price=Decimal("20.00"), msrp=Decimal("100.00"))
+    
+    assert [deal.id for deal in ranker.get_deals_by_sport(deals, Sport.SOCCER)] == ["b"]
+    assert [deal.id for deal in ranker.get_deals_by_price_range(deals, 0, 25)] == ["c"]
+    assert [deal.id for deal in ranker.get_deals_by_multiple_criteria(deals, sport=Sport.BASKETBALL)] == ["c"]
+
+
+def test_get_top_deals():
+    """Test top deal selection with a discount threshold."""
+    ranker = DealRanker(min_discount=20.0)
+    deals = [
+        make_deal(id="a", price=Decimal("70.00"), msrp=Decimal("100.00")),
+        make_deal(id="b", price=Decimal("95.00"), msrp=Decimal("100.00")),  # Below threshold
+        make_deal(id="c", price=Decimal("40.00"), msrp=Decimal("100.00")),
+        make_deal(id="d", price=Decimal("50.00"), msrp=Decimal("100.00")),
+    ]
+    
+    top_deals = ranker.get_top_deals(deals, limit=2)
+    assert [deal.id for deal in top_deals] == ["c", "d"]
+    
+    # Deals filtered out by the threshold are not scored
+    assert deals[1].score is None
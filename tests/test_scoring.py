@@ -3,7 +3,8 @@
 import pytest
 from decimal import Decimal
 
-from src.models import Deal, Sport, Category, Currency
+from src.models import Deal, Sport
+from src.utils import scoring
 from src.utils.scoring import (
     calculate_discount_score,
     calculate_price_score,
@@ -13,42 +14,42 @@ from src.utils.scoring import (
     calculate_composite_score,
     rank_deals,
     get_top_deals_by_sport,
+    get_cached_scores,
+    clear_score_cache,
 )
+from tests._factories import make_deal
+
+# Shared Decimal prices (Decimals are immutable, so reuse is safe)
+P = {n: Decimal(f"{n}.00") for n in (0, 10, 15, 20, 40, 50, 60, 80, 100, 150, 1000)}
 
 
 def test_calculate_discount_score():
     """Test discount score calculation."""
     # Test high discount
-    deal = Deal(
+    deal = make_deal(
         id="test-1",
         title="Test Product",
-        price=Decimal("20.00"),
-        msrp=Decimal("100.00"),
-        retailer="Test",
-        canonical_url="https://example.com/1"
+        price=P[20],
+        msrp=P[100],
     )
     score = calculate_discount_score(deal)
-    assert score == 45.0  # 80% discount, capped at 45
+    assert score == 50.0  # 80% discount: capped at 45, plus the 70%+ bonus
     
     # Test medium discount
-    deal = Deal(
+    deal = make_deal(
         id="test-2",
         title="Test Product",
-        price=Decimal("60.00"),
-        msrp=Decimal("100.00"),
-        retailer="Test",
-        canonical_url="https://example.com/2"
+        price=P[60],
+        msrp=P[100],
     )
     score = calculate_discount_score(deal)
     assert score == 36.0  # 40% discount
     
     # Test no discount
-    deal = Deal(
+    deal = make_deal(
         id="test-3",
         title="Test Product",
-        price=Decimal("100.00"),
-        retailer="Test",
-        canonical_url="https://example.com/3"
+        price=P[100],
     )
     score = calculate_discount_score(deal)
     assert score == 0.0
@@ -57,34 +58,28 @@ def test_calculate_discount_score():
 def test_calculate_price_score():
     """Test price score calculation."""
     # Test low price (high score)
-    deal = Deal(
+    deal = make_deal(
         id="test-1",
         title="Test Product",
-        price=Decimal("15.00"),
-        retailer="Test",
-        canonical_url="https://example.com/1"
+        price=P[15],
     )
     score = calculate_price_score(deal)
     assert score == 20.0
     
     # Test medium price
-    deal = Deal(
+    deal = make_deal(
         id="test-2",
         title="Test Product",
-        price=Decimal("50.00"),
-        retailer="Test",
-        canonical_url="https://example.com/2"
+        price=P[50],
     )
     score = calculate_price_score(deal)
     assert score == 12.5
     
     # Test high price (low score)
-    deal = Deal(
+    deal = make_deal(
         id="test-3",
         title="Test Product",
-        price=Decimal("150.00"),
-        retailer="Test",
-        canonical_url="https://example.com/3"
+        price=P[150],
     )
     score = calculate_price_score(deal)
     assert score == 2.5
@@ -93,12 +88,10 @@ def test_calculate_price_score():
 def test_calculate_youth_score():
     """Test youth score calculation."""
     # Test youth deal
-    deal = Deal(
+    deal = make_deal(
         id="test-1",
         title="Nike Youth Soccer Cleats",
-        price=Decimal("40.00"),
-        retailer="Test",
-        canonical_url="https://example.com/1",
+        price=P[40],
         youth_flag=True,
         sizes=["YS", "YM", "YL"]
     )
@@ -106,12 +99,10 @@ def test_calculate_youth_score():
     assert score == 20.0  # Full youth score
     
     # Test adult deal
-    deal = Deal(
+    deal = make_deal(
         id="test-2",
         title="Nike Adult Running Shoes",
-        price=Decimal("80.00"),
-        retailer="Test",
-        canonical_url="https://example.com/2",
+        price=P[80],
         youth_flag=False,
         sizes=["M", "L", "XL"]
     )
@@ -119,12 +110,10 @@ def test_calculate_youth_score():
     assert score == 0.0
     
     # Test ambiguous deal with youth sizes
-    deal = Deal(
+    deal = make_deal(
         id="test-3",
         title="Soccer Cleats",
-        price=Decimal("50.00"),
-        retailer="Test",
-        canonical_url="https://example.com/3",
+        price=P[50],
         youth_flag=False,
         sizes=["YS", "YM", "YL"]
     )
@@ -135,36 +124,30 @@ def test_calculate_youth_score():
 def test_calculate_brand_score():
     """Test brand score calculation."""
     # Test premium brand
-    deal = Deal(
+    deal = make_deal(
         id="test-1",
         title="Nike Soccer Cleats",
-        price=Decimal("80.00"),
-        retailer="Test",
-        canonical_url="https://example.com/1",
+        price=P[80],
         brand="Nike"
     )
     score = calculate_brand_score(deal)
     assert score == 8.5  # Nike brand score
     
     # Test unknown brand
-    deal = Deal(
+    deal = make_deal(
         id="test-2",
         title="Generic Soccer Cleats",
-        price=Decimal("40.00"),
-        retailer="Test",
-        canonical_url="https://example.com/2",
+        price=P[40],
         brand="Generic Brand"
     )
     score = calculate_brand_score(deal)
     assert score == 5.0  # Default brand score
     
     # Test sport-specific brand
-    deal = Deal(
+    deal = make_deal(
         id="test-3",
         title="Bauer Hockey Stick",
-        price=Decimal("100.00"),
-        retailer="Test",
-        canonical_url="https://example.com/3",
+        price=P[100],
         brand="Bauer",
         sport=Sport.HOCKEY
     )
@@ -175,38 +158,32 @@ def test_calculate_brand_score():
 def test_calculate_inventory_score():
     """Test inventory score calculation."""
     # Test in stock deal
-    deal = Deal(
+    deal = make_deal(
         id="test-1",
         title="Test Product",
-        price=Decimal("50.00"),
-        retailer="Test",
-        canonical_url="https://example.com/1",
+        price=P[50],
         in_stock=True,
         sizes=["S", "M", "L"],
         coupon_code="SAVE10"
     )
     score = calculate_inventory_score(deal)
-    assert score == 5.0  # In stock + good sizes + coupon
+    assert score == 4.0  # In stock (2) + good sizes (1) + coupon (1)
     
     # Test out of stock deal
-    deal = Deal(
+    deal = make_deal(
         id="test-2",
         title="Test Product",
-        price=Decimal("50.00"),
-        retailer="Test",
-        canonical_url="https://example.com/2",
+        price=P[50],
         in_stock=False
     )
     score = calculate_inventory_score(deal)
     assert score == 0.0  # Out of stock penalty
     
     # Test limited stock deal
-    deal = Deal(
+    deal = make_deal(
         id="test-3",
         title="Test Product",
-        price=Decimal("50.00"),
-        retailer="Test",
-        canonical_url="https://example.com/3",
+        price=P[50],
         in_stock=True,
         stock_level="limited"
     )
@@ -214,16 +191,43 @@ def test_calculate_inventory_score():
     assert score == 3.0  # In stock + limited stock bonus
 
 
+def test_validated_deal_scores_like_factory_deal():
+    """Test that a validated Deal scores the same as its make_deal counterpart."""
+    fields = dict(
+        id="test-validated",
+        title="Nike Youth Soccer Cleats",
+        price=P[40],
+        msrp=P[80],
+        brand="Nike",
+        sport=Sport.SOCCER,
+        youth_flag=True,
+        sizes=["YS", "YM", "YL"],
+        in_stock=True,
+        retailer="Test",
+        canonical_url="https://example.com/product",
+    )
+    validated = Deal(**fields)
+    constructed = make_deal(**fields)
+    
+    assert str(validated.canonical_url).startswith("https://example.com/")
+    for calculate in (
+        calculate_discount_score,
+        calculate_price_score,
+        calculate_youth_score,
+        calculate_brand_score,
+        calculate_inventory_score,
+    ):
+        assert calculate(validated) == calculate(constructed), calculate.__name__
+
+
 def test_calculate_composite_score():
     """Test composite score calculation."""
     # Test high-scoring deal
-    deal = Deal(
+    deal = make_deal(
         id="test-1",
         title="Nike Youth Soccer Cleats",
-        price=Decimal("20.00"),
-        msrp=Decimal("80.00"),
-        retailer="Test",
-        canonical_url="https://example.com/1",
+        price=P[20],
+        msrp=P[80],
         brand="Nike",
         youth_flag=True,
         in_stock=True,
@@ -234,12 +238,10 @@ def test_calculate_composite_score():
     assert score > 80  # Should be a high score
     
     # Test low-scoring deal
-    deal = Deal(
+    deal = make_deal(
         id="test-2",
         title="Generic Adult Shoes",
-        price=Decimal("100.00"),
-        retailer="Test",
-        canonical_url="https://example.com/2",
+        price=P[100],
         brand="Generic",
         youth_flag=False,
         in_stock=False
@@ -248,31 +250,41 @@ def test_calculate_composite_score():
     assert score < 30  # Should be a low score
 
 
-def test_rank_deals(sample_deals):
+def test_rank_deals(scored_sample_deals):
     """Test deal ranking functionality."""
-    # Add scores to deals
-    for deal in sample_deals:
-        deal.score = calculate_composite_score(deal)
-    
     # Rank deals
-    ranked = rank_deals(sample_deals, min_discount=0.0)
+    ranked = rank_deals(scored_sample_deals, min_discount=0.0)
     
     # Check that deals are sorted by score (descending)
     for i in range(len(ranked) - 1):
         assert ranked[i].score >= ranked[i + 1].score
     
     # Check that all deals are included
-    assert len(ranked) == len(sample_deals)
+    assert len(ranked) == len(scored_sample_deals)
 
 
-def test_get_top_deals_by_sport(sample_deals):
-    """Test getting top deals by sport."""
-    # Add scores to deals
-    for deal in sample_deals:
-        deal.score = calculate_composite_score(deal)
+def test_rank_deals_leaves_filtered_deals_unscored():
+    """Test that deals below the discount threshold keep their existing scores."""
+    unscored = make_deal(id="unscored", price=P[80], msrp=P[100])  # 20% off
+    stale = make_deal(id="stale", price=P[80], msrp=P[100], score=99.0, relevance_score=1.0)
+    passing = make_deal(id="passing", price=P[40], msrp=P[100])  # 60% off
     
+    for limit in (None, 1):
+        ranked = rank_deals([unscored, stale, passing], min_discount=50.0, limit=limit)
+        assert [deal.id for deal in ranked] == ["passing"]
+        assert passing.score is not None
+        assert passing.relevance_score is not None
+        
+        assert unscored.score is None
+        assert unscored.relevance_score is None
+        assert stale.score == 99.0
+        assert stale.relevance_score == 1.0
+
+
+def test_get_top_deals_by_sport(scored_sample_deals):
+    """Test getting top deals by sport."""
     # Get top deals by sport
-    sport_deals = get_top_deals_by_sport(sample_deals, top_per_sport=2)
+    sport_deals = get_top_deals_by_sport(scored_sample_deals, top_per_sport=2)
     
     # Check that we have deals for each sport
     assert Sport.BASKETBALL in sport_deals
@@ -291,35 +303,78 @@ def test_get_top_deals_by_sport(sample_deals):
 def test_score_edge_cases():
     """Test scoring with edge cases."""
     # Test deal with no MSRP
-    deal = Deal(
+    deal = make_deal(
         id="test-1",
         title="Test Product",
-        price=Decimal("50.00"),
-        retailer="Test",
-        canonical_url="https://example.com/1"
+        price=P[50],
     )
     score = calculate_composite_score(deal)
     assert score >= 0  # Should not crash
     
     # Test deal with zero price
-    deal = Deal(
+    deal = make_deal(
         id="test-2",
         title="Free Product",
-        price=Decimal("0.00"),
-        retailer="Test",
-        canonical_url="https://example.com/2"
+        price=P[0],
     )
     score = calculate_composite_score(deal)
     assert score >= 0  # Should not crash
     
     # Test deal with very high discount (potential fake MSRP)
-    deal = Deal(
+    deal = make_deal(
         id="test-3",
         title="Test Product",
-        price=Decimal("10.00"),
-        msrp=Decimal("1000.00"),  # 99% discount
-        retailer="Test",
-        canonical_url="https://example.com/3"
+        price=P[10],
+        msrp=P[1000],  # 99% discount
     )
     score = calculate_composite_score(deal)
     assert score <= 100  # Should be capped
+
+
+def _uncached_scores(deal):
+    """Score a deal from an empty cache."""
+    clear_score_cache()
+    return get_cached_scores(deal)
+
+
+def test_score_cache_tracks_deal_content():
+    """Test that cached scores follow changes to price, discount and stock."""
+    clear_score_cache()
+    deal = make_deal(price=P[50], msrp=P[100], in_stock=True)
+    scores = get_cached_scores(deal)
+    assert get_cached_scores(deal) is scores  # Unchanged content hits the cache
+    
+    # Each edit must miss the entry cached for the previous content
+    for field, value in [("price", P[20]), ("msrp", P[40]), ("in_stock", False)]:
+        setattr(deal, field, value)
+        previous, scores = scores, get_cached_scores(deal)
+        assert scores != previous, field
+        assert scores == _uncached_scores(deal), field
+
+
+def test_clear_score_cache():
+    """Test clearing the score cache."""
+    get_cached_scores(make_deal())
+    assert scoring._SCORE_CACHE
+    
+    clear_score_cache()
+    assert not scoring._SCORE_CACHE
+
+
+def test_score_cache_size_cap(monkeypatch):
+    """Test that a full score cache evicts its least recently used entry."""
+    monkeypatch.setattr(scoring, "_SCORE_CACHE_MAX_SIZE", 2)
+    clear_score_cache()
+    
+    reused = make_deal(price=P[10])
+    unused = make_deal(price=P[20])
+    get_cached_scores(reused)
+    get_cached_scores(unused)
+    get_cached_scores(reused)  # Now the most recently used
+    
+    added = make_deal(price=P[40])
+    scores = get_cached_scores(added)
+    assert len(scoring._SCORE_CACHE) == 2
+    assert scoring._score_cache_key(unused) not in scoring._SCORE_CACHE
+    assert scoring._score_cache_key(reused) in scoring._SCORE_CACHE
+    assert scores == _uncached_scores(added)